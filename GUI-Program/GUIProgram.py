@@ -22,11 +22,13 @@
 #   - PyQt6 (>=6.0.0)
 #   - OpenCV (>=4.0.0)
 #   - NumPy (>=1.19.0)
+#   - Numba (optional, JIT-compiles the loop-based conversion)
 #
 # Installation steps:
 #   1. pip install PyQt6>=6.0.0
 #   2. pip install opencv-python>=4.0.0
 #   3. pip install numpy>=1.19.0
+#   4. pip install numba (optional)
 #
 # @section USAGE
 # To run the application:
@@ -69,6 +71,7 @@
 import sys
 import os
 import time
+import threading
 
 # Image processing imports
 import cv2
@@ -84,9 +87,240 @@ from PyQt6.QtWidgets import (
     QGraphicsPixmapItem
 )
 from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 from PyQt6 import QtCore, uic
 
+# Optional JIT imports
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+## Serializes parallel kernel launches: Numba's default workqueue threading
+## layer aborts if two threads (GUI, frame and compare workers) enter it at once
+_KERNEL_LOCK = threading.Lock()
+
+## Per-sector 0/1 weights saying whether the R, G and B rows take the x term; see _hsv_pixel_to_rgb
+SECTOR_X = np.array([[0, 1, 0, 0, 1, 0],
+                     [1, 0, 0, 1, 0, 0],
+                     [0, 0, 1, 0, 0, 1]], dtype=np.int32)
+
+## Per-sector 0/1 weights saying whether the R, G and B rows take the zero term
+SECTOR_Z = np.array([[0, 0, 1, 1, 0, 0],
+                     [0, 0, 0, 0, 1, 1],
+                     [1, 1, 0, 0, 0, 0]], dtype=np.int32)
+
+## Largest test image the interpreted (non-Numba) loop is benchmarked on
+LOOP_MAX_PIXELS = 40000
+
+## Number of timed runs averaged per method and size in compare_methods
+COMPARE_RUNS = 5
+
+## Maximum (width, height) of the live preview; matches the graphics views
+PREVIEW_SIZE = (256, 170)
+
+## Test image sizes (width, height) benchmarked by compare_methods
+COMPARE_SIZES = [(100, 100), (400, 400), (800, 800)]
+
+
+def _hsv_pixel_to_rgb(h, s, v):
+    """Convert one OpenCV-scaled HSV pixel to RGB using integer arithmetic.
+    
+    @brief Per-pixel formula of the interpreted loop in hsv_to_rgb_loop
+    
+    @param h Hue (0-180)
+    @type h int
+    @param s Saturation (0-255)
+    @type s int
+    @param v Value (0-255)
+    @type v int
+    @return Tuple (r, g, b) with values in 0-255
+    @rtype tuple(int, int, int)
+    
+    @details OpenCV hue is an integer number of 2-degree steps, so the
+            60-degree sector is h // 30 and x / c = 1 - |(h / 30) % 2 - 1|
+            is (30 - |h % 60 - 30|) / 30. Every channel is then
+            v - v*s*(1 - w) / 255 for a weight w of c (1), x (x / c) or 0,
+            which is evaluated exactly and rounded down like the float
+            formula, so the result does not depend on float rounding
+    """
+    sector = min(h // 30, 5)
+    x30 = 30 - abs(h % 60 - 30)
+    vs = v * s
+    
+    c = v
+    x = v - (vs * (30 - x30) + 7649) // 7650  # 7650 = 255 * 30
+    z = v - (vs + 254) // 255
+    
+    if sector == 0:
+        return c, x, z
+    elif sector == 1:
+        return x, c, z
+    elif sector == 2:
+        return z, c, x
+    elif sector == 3:
+        return z, x, c
+    elif sector == 4:
+        return x, z, c
+    else:
+        return c, z, x
+
+
+if _HAS_NUMBA:
+    @njit(fastmath=True, cache=True)
+    def _hsv_pixel_to_rgb_nb(h, s, v):
+        """Branchless compiled form of _hsv_pixel_to_rgb; inlined into the kernel below.
+        
+        @details Computes the same x and zero drops and picks them per
+                channel with the sector's SECTOR_X/SECTOR_Z weights, so the
+                compiled loop body is straight-line integer arithmetic. The
+                interpreted loop keeps the branches, which are cheaper than
+                table lookups in Python
+        """
+        sector = min(h // 30, 5)
+        x30 = 30 - abs(h % 60 - 30)
+        vs = v * s
+        dx = (vs * (30 - x30) + 7649) // 7650
+        dz = (vs + 254) // 255
+        
+        return (v - SECTOR_X[0, sector] * dx - SECTOR_Z[0, sector] * dz,
+                v - SECTOR_X[1, sector] * dx - SECTOR_Z[1, sector] * dz,
+                v - SECTOR_X[2, sector] * dx - SECTOR_Z[2, sector] * dz)
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _hsv_to_rgb_loop_nb(hsv_img):
+        """JIT-compiled pixel loop behind HSVAdjustmentApp.hsv_to_rgb_loop.
+        
+        @brief Convert a uint8 HSV image to uint8 RGB one pixel at a time
+        
+        @param hsv_img Input HSV image in OpenCV format (H: 0-180, S/V: 0-255)
+        @type hsv_img numpy.ndarray (uint8, H x W x 3)
+        @return RGB image in uint8 format
+        @rtype numpy.ndarray
+        
+        @details Applies the exact integer formula of the interpreted loop
+                (_hsv_pixel_to_rgb) in its branchless form, so both paths
+                give the same pixels. Rows are split across threads with
+                prange
+        """
+        height, width = hsv_img.shape[:2]
+        rgb_img = np.empty((height, width, 3), dtype=np.uint8)
+        
+        for i in prange(height):
+            for j in range(width):
+                rgb_img[i, j, 0], rgb_img[i, j, 1], rgb_img[i, j, 2] = _hsv_pixel_to_rgb_nb(
+                    int(hsv_img[i, j, 0]), int(hsv_img[i, j, 1]), int(hsv_img[i, j, 2]))
+        
+        return rgb_img
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _adjust_hsv_u8(hsv_u8, hue_lut, sat_lut, gamma_lut, out):
+        """Fused HSV adjustment kernel used by HSVAdjustmentApp.update_image.
+        
+        @brief Apply hue shift, saturation scale and value gamma in one pass
+        
+        @param hsv_u8 Input HSV image in OpenCV format (uint8, H x W x 3)
+        @param hue_lut 256-entry uint8 lookup table for the hue channel
+        @param sat_lut 256-entry uint8 lookup table for the saturation channel
+        @param gamma_lut 256-entry uint8 lookup table for the value channel
+        @param out Preallocated uint8 output with the same shape as hsv_u8
+        
+        @details Each pixel is read once, adjusted in registers and written
+                once, replacing the multi-pass float32 NumPy pipeline.
+                All three channels are table lookups, so there is no
+                per-pixel modulo or pow
+        """
+        height, width = hsv_u8.shape[:2]
+        
+        for i in prange(height):
+            for j in range(width):
+                out[i, j, 0] = hue_lut[hsv_u8[i, j, 0]]
+                out[i, j, 1] = sat_lut[hsv_u8[i, j, 1]]
+                out[i, j, 2] = gamma_lut[hsv_u8[i, j, 2]]
+
+
+class FrameWorkerSignals(QObject):
+    """Signals emitted by FrameWorker.
+    
+    @brief Carrier for FrameWorker results
+    
+    @details QRunnable is not a QObject, so the signal lives on this helper.
+             It is created on the GUI thread, which makes emissions from the
+             pool thread arrive through a queued connection
+    """
+    
+    ## Emitted with (generation, rgb_image) when processing completes
+    finished = pyqtSignal(int, object)
+
+
+class FrameWorker(QRunnable):
+    """Run one image-processing job on a QThreadPool thread.
+    
+    @brief Background runnable for HSV adjustment and conversion
+    
+    @details Calls the given job and emits its result together with the
+             generation number it was submitted with, so the receiver can
+             drop results from superseded slider positions
+    """
+    
+    def __init__(self, generation, job):
+        """Create a worker for a single job.
+        
+        @param generation Generation counter value at submission time
+        @type generation int
+        @param job Callable returning the processed RGB image
+        @type job callable
+        """
+        super().__init__()
+        self.generation = generation
+        self.job = job
+        self.signals = FrameWorkerSignals()
+    
+    def run(self):
+        """Execute the job and emit its result."""
+        self.signals.finished.emit(self.generation, self.job())
+
+
+class CompareWorkerSignals(QObject):
+    """Signals emitted by CompareWorker.
+    
+    @brief Carrier for CompareWorker progress
+    """
+    
+    ## Emitted with one formatted result line per benchmarked size
+    row = pyqtSignal(str)
+    ## Emitted once all sizes are done (or the benchmark failed)
+    finished = pyqtSignal()
+
+
+class CompareWorker(QRunnable):
+    """Run the conversion benchmark on a QThreadPool thread.
+    
+    @brief Background runnable for compare_methods
+    
+    @details Iterates a generator of result lines and emits each one as soon
+             as it is produced, so rows can be shown while later sizes run
+    """
+    
+    def __init__(self, rows):
+        """Create a worker for a benchmark.
+        
+        @param rows Generator yielding one result line per image size
+        @type rows generator
+        """
+        super().__init__()
+        self.rows = rows
+        self.signals = CompareWorkerSignals()
+    
+    def run(self):
+        """Emit each result line, then signal completion."""
+        try:
+            for row in self.rows:
+                self.signals.row.emit(row)
+        finally:
+            self.signals.finished.emit()
+
 
 class HSVAdjustmentApp(QWidget):
     """Main application class for HSV image adjustment.
@@ -133,7 +367,39 @@ class HSVAdjustmentApp(QWidget):
         self.original_image = None
         self.adjusted_image = None
         self.hsv_image = None
-        self.current_hsv = None
+        self._hsv_preview = None
+        self._hsv_out = None
+        self._adjusted_preview = None
+        self._q_adj_img = None
+        self._adj_pixmap_item = None
+        self._hsv_full = None
+        self._adjusted = False
+        self._orig_pixmap = None
+        self._bgr_scratch = None
+        self._compare_box = None
+        self._compare_rows = []
+        
+        # Version of the HSV adjustment, bumped on load and on every submitted
+        # update; caches derived from the full-resolution HSV are tagged with it
+        self._hsv_version = 0
+        self._hsv_full_version = -1
+        self._compare_pyramid = {}
+        self._compare_pyramid_version = -1
+        
+        # Background processing state (only touched on the GUI thread)
+        self._generation = 0
+        self._busy = False
+        self._rerun = False
+        
+        # Per-byte lookup tables for hue, saturation and value, rebuilt on slider change
+        self._hue_lut = np.empty(256, dtype=np.uint8)
+        self._sat_lut = np.empty(256, dtype=np.uint8)
+        self._gamma_lut = np.empty(256, dtype=np.uint8)
+        
+        # Which pipeline stages are stale, set by the per-slider slots
+        self._dirty_hue = True
+        self._dirty_sat_lut = True
+        self._dirty_gamma_lut = True
         
         # Connect UI elements
         self.UploadButton.clicked.connect(self.load_image)
@@ -141,10 +407,23 @@ class HSVAdjustmentApp(QWidget):
         self.SaveLoopButton.clicked.connect(lambda: self.save_image('loop'))
         self.CompareButton.clicked.connect(self.compare_methods)
         
-        # Connect sliders
-        self.HueSlider.valueChanged.connect(self.update_sliders_and_image)
-        self.SaturatedSlider.valueChanged.connect(self.update_sliders_and_image)
-        self.ValueSlider.valueChanged.connect(self.update_sliders_and_image)
+        # Latest (hue, saturation, value) slider positions not yet processed
+        self._pending = None
+        
+        # Coalesce bursts of slider events into one update per ~16 ms frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self.update_image)
+        
+        # Connect sliders (valueChanged also covers keyboard steps; releasing a
+        # dragged slider renders its final position without waiting for the timer)
+        self.HueSlider.valueChanged.connect(self._on_hue_changed)
+        self.SaturatedSlider.valueChanged.connect(self._on_sat_changed)
+        self.ValueSlider.valueChanged.connect(self._on_val_changed)
+        self.HueSlider.sliderReleased.connect(self.flush_pending_update)
+        self.SaturatedSlider.sliderReleased.connect(self.flush_pending_update)
+        self.ValueSlider.sliderReleased.connect(self.flush_pending_update)
         
         # Setup graphics scenes
         self.original_scene = QGraphicsScene()
@@ -159,6 +438,13 @@ class HSVAdjustmentApp(QWidget):
         # Set the fixed size of the graphics views to 256x170
         self.graphicsView.setFixedSize(256, 170)  
         self.graphicsView_2.setFixedSize(256, 170)
+        
+        # Compile the kernels now so the first slider move/save is not billed for it
+        if _HAS_NUMBA:
+            _hsv_to_rgb_loop_nb(np.zeros((1, 1, 3), dtype=np.uint8))
+            identity_lut = np.arange(256, dtype=np.uint8)
+            _adjust_hsv_u8(np.zeros((1, 1, 3), dtype=np.uint8), identity_lut, identity_lut,
+                           identity_lut, np.empty((1, 1, 3), dtype=np.uint8))
 
 
     def update_slider_labels(self):
@@ -175,6 +461,34 @@ class HSVAdjustmentApp(QWidget):
         self.SaturationValue.setText(str(self.SaturatedSlider.value()))
         self.SaturationValue_2.setText(str(self.ValueSlider.value()))
     
+    def update_luts(self, hue_shift, saturation_factor, gamma):
+        """Rebuild the hue, saturation and gamma lookup tables whose slider moved.
+        
+        @brief Keep the per-byte H/S/V lookup tables in sync with the sliders
+        
+        @param hue_shift Hue offset in OpenCV units (0-180)
+        @type hue_shift int
+        @param saturation_factor Saturation multiplication factor
+        @type saturation_factor float
+        @param gamma Exponent applied to the normalized value channel
+        @type gamma float
+        
+        @details Every H/S/V byte maps to exactly one output byte, so the 256
+                results are computed once and applied with a table lookup
+                instead of a modulo/multiply/pow per pixel. A table is only
+                rebuilt when its dirty flag was set by the slider's slot
+        """
+        levels = np.arange(256)
+        if self._dirty_hue:
+            self._hue_lut[:] = (levels.astype(np.int32) + int(hue_shift)) % 180
+            self._dirty_hue = False
+        if self._dirty_sat_lut:
+            self._sat_lut[:] = np.clip(levels * saturation_factor, 0, 255)
+            self._dirty_sat_lut = False
+        if self._dirty_gamma_lut:
+            self._gamma_lut[:] = np.clip((levels / 255.0) ** gamma * 255.0, 0, 255)
+            self._dirty_gamma_lut = False
+    
     @pyqtSlot()
     def load_image(self):
         """Load an image file selected through a file dialog.
@@ -187,7 +501,7 @@ class HSVAdjustmentApp(QWidget):
         @exception IOError If the image file cannot be read
         @exception cv2.error If OpenCV fails to process the image
         @exception MemoryError If image is too large to process
-        @see show_images For display update
+        @see _refresh_adjusted For the adjusted image display
         """
         file_dialog = QFileDialog()
         file_dialog.setNameFilter("Image files (*.jpg *.jpeg *.png *.bmp)")
@@ -197,23 +511,103 @@ class HSVAdjustmentApp(QWidget):
                 # Load and process the image
                 self.original_image = cv2.imread(self.image_path)
                 self.original_image = cv2.cvtColor(self.original_image, cv2.COLOR_BGR2RGB)
-                self.adjusted_image = self.original_image.copy()
-                self.hsv_image = cv2.cvtColor(self.original_image, cv2.COLOR_RGB2HSV).astype(np.float32)
-                self.current_hsv = self.hsv_image.copy()
-                self.show_images()
+                self.hsv_image = cv2.cvtColor(self.original_image, cv2.COLOR_RGB2HSV)
+                self._adjusted = False
+                self._generation += 1  # Drop any frame still computed for the previous image
+                self._dirty_hue = self._dirty_sat_lut = self._dirty_gamma_lut = True  # Fresh buffers
+                self._hsv_version += 1
+                
+                # Live editing runs on a copy no larger than the graphics view.
+                # Resize in RGB so hue is not averaged across its 179/0 wrap
+                orig_height, orig_width = self.original_image.shape[:2]
+                scale = min(PREVIEW_SIZE[0] / orig_width, PREVIEW_SIZE[1] / orig_height, 1.0)
+                preview_size = (max(1, round(orig_width * scale)), max(1, round(orig_height * scale)))
+                preview_rgb = cv2.resize(self.original_image, preview_size, interpolation=cv2.INTER_AREA)
+                self._hsv_preview = cv2.cvtColor(preview_rgb, cv2.COLOR_RGB2HSV)
+                
+                # Output buffers reused by every update_image/save_image call
+                self._hsv_out = np.empty_like(self._hsv_preview)
+                self._adjusted_preview = preview_rgb
+                self.adjusted_image = self._adjusted_preview
+                self._hsv_full = np.empty_like(self.hsv_image)
+                self._bgr_scratch = np.empty_like(self.original_image)
+                
+                # The original never changes after load, so its pixmap is built once
+                q_orig_img = QImage(self.original_image.data, orig_width, orig_height,
+                                    3 * orig_width, QImage.Format.Format_RGB888)
+                self._orig_pixmap = QPixmap.fromImage(q_orig_img)
+                
+                self.original_scene.clear()
+                pixmap_item = QGraphicsPixmapItem(self._orig_pixmap)
+                self.original_scene.addItem(pixmap_item)
+                self.graphicsView.fitInView(pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+                
+                # The adjusted view is bound to the preview buffer for the image's lifetime
+                preview_width, preview_height = preview_size
+                self._q_adj_img = QImage(self._adjusted_preview.data, preview_width, preview_height,
+                                         3 * preview_width, QImage.Format.Format_RGB888)
+                self.adjusted_scene.clear()
+                self._adj_pixmap_item = QGraphicsPixmapItem()
+                self.adjusted_scene.addItem(self._adj_pixmap_item)
+                self._refresh_adjusted()
+                self.graphicsView_2.fitInView(self._adj_pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+                
+                self.compare_pyramid()
+    
+    @pyqtSlot(int)
+    def _on_hue_changed(self, value):
+        """Mark the hue stage stale and queue an update.
+        
+        @param value New Hue slider value
+        @type value int
+        """
+        self._dirty_hue = True
+        self.update_sliders_and_image()
+    
+    @pyqtSlot(int)
+    def _on_sat_changed(self, value):
+        """Mark the saturation lookup table stale and queue an update.
+        
+        @param value New Saturation slider value
+        @type value int
+        """
+        self._dirty_sat_lut = True
+        self.update_sliders_and_image()
+    
+    @pyqtSlot(int)
+    def _on_val_changed(self, value):
+        """Mark the gamma lookup table stale and queue an update.
+        
+        @param value New Value slider value
+        @type value int
+        """
+        self._dirty_gamma_lut = True
+        self.update_sliders_and_image()
     
     def update_sliders_and_image(self):
         """Handle slider value changes and update the image.
         
         @brief Update image processing based on slider changes
         
-        @details Updates both the slider value labels and processes the image
-                when any HSV slider value changes
+        @details Records the slider positions in self._pending, updates the
+                slider value labels immediately and (re)starts the debounce
+                timer. A drag (or several sliders changing together) that fires
+                many valueChanged signals therefore only reprocesses the image
+                once per timer interval, with the latest values
         
         @exception ValueError If slider values are out of valid range
         @see update_image For the actual image processing
         """
+        self._pending = (self.HueSlider.value(), self.SaturatedSlider.value(), self.ValueSlider.value())
         self.update_slider_labels()
+        self._update_timer.start()
+    
+    def flush_pending_update(self):
+        """Process any pending slider change now instead of waiting for the timer.
+        
+        @see update_sliders_and_image For how changes are queued
+        """
+        self._update_timer.stop()
         self.update_image()
     
     def update_image(self):
@@ -225,72 +619,134 @@ class HSVAdjustmentApp(QWidget):
                 - Hue shift (0-180 degrees)
                 - Saturation multiplication (0-200%)
                 - Value/brightness gamma adjustment (0-200%)
+                The pending slider values are consumed here and the processing runs on
+                a QThreadPool thread; the result is shown by _on_frame_ready.
+                While a frame is in flight, further requests are collapsed into
+                a single rerun once it completes
         
         @exception ValueError If adjustment values are out of valid range
         @exception RuntimeError If image processing fails
         @exception MemoryError If insufficient memory for processing
-        @see hsv_to_rgb_matrix For the color space conversion
-        @see show_images For the display update
+        @see adjust_hsv For the HSV adjustment
+        @see _on_frame_ready For the display update
         """
-        if self.original_image is None:
+        if self.original_image is None or self._pending is None:
             return
         
-        hue_shift = self.HueSlider.value() / 2 # OpenCV uses 0-180 for hue
-        saturation_factor = self.SaturatedSlider.value() / 100.0
-        gamma = self.ValueSlider.value() / 100.0
+        if self._busy:
+            self._rerun = True
+            return
         
-        current_hsv = self.hsv_image.copy()
-        current_hsv[:, :, 0] = (current_hsv[:, :, 0] + hue_shift) % 180  # OpenCV uses 0-180 for hue
-        current_hsv[:, :, 1] = np.clip(current_hsv[:, :, 1] * saturation_factor, 0, 255)
-
-        normalized_value = current_hsv[:, :, 2] / 255.0
-        modified_value = np.power(normalized_value, gamma) * 255.0
-        current_hsv[:, :, 2] = np.clip(modified_value, 0, 255)
+        hue, saturation, value = self._pending
+        self._pending = None
+        
+        hue_shift = hue // 2 # OpenCV uses 0-180 for hue
+        saturation_factor = saturation / 100.0
+        gamma = value / 100.0
+        
+        # The preview HSV buffer still holds the planes whose slider did not move
+        planes = [plane for plane, dirty in
+                  enumerate((self._dirty_hue, self._dirty_sat_lut, self._dirty_gamma_lut)) if dirty]
+        self.update_luts(hue_shift, saturation_factor, gamma)
+        self._adjusted = True
+        self._hsv_version += 1
+        
+        hsv_src, hsv_out, rgb_out = self._hsv_preview, self._hsv_out, self._adjusted_preview
+        
+        def job():
+            self.adjust_hsv(hsv_src, hsv_out, planes)
+            return cv2.cvtColor(hsv_out, cv2.COLOR_HSV2RGB, dst=rgb_out)
         
-        self.current_hsv = current_hsv
-        self.adjusted_image = cv2.cvtColor(current_hsv.astype(np.uint8), cv2.COLOR_HSV2RGB)
-        self.show_images()
+        self._generation += 1
+        self._busy = True
+        worker = FrameWorker(self._generation, job)
+        worker.signals.finished.connect(self._on_frame_ready)
+        QThreadPool.globalInstance().start(worker)
     
-    def show_images(self):
-        """Display both original and adjusted images in the UI.
+    def adjust_hsv(self, hsv_src, hsv_dst, planes=(0, 1, 2)):
+        """Apply the current H/S/V lookup tables to an HSV image.
+        
+        @brief Write the adjusted copy of hsv_src into hsv_dst
+        
+        @param hsv_src Input HSV image in OpenCV format (uint8)
+        @type hsv_src numpy.ndarray
+        @param hsv_dst Preallocated uint8 output with the same shape as hsv_src
+        @type hsv_dst numpy.ndarray
+        @param planes HSV planes to recompute; the others are left as they are
+                in hsv_dst. The fused Numba kernel always writes all three
+        @type planes sequence of int
+        @return hsv_dst
+        @rtype numpy.ndarray
+        
+        @see update_luts For the lookup tables
+        """
+        if _HAS_NUMBA:
+            with _KERNEL_LOCK:
+                _adjust_hsv_u8(hsv_src, self._hue_lut, self._sat_lut, self._gamma_lut, hsv_dst)
+        else:
+            if 0 in planes:
+                hsv_dst[:, :, 0] = cv2.LUT(hsv_src[:, :, 0], self._hue_lut)
+            if 1 in planes:
+                hsv_dst[:, :, 1] = cv2.LUT(hsv_src[:, :, 1], self._sat_lut)
+            if 2 in planes:
+                hsv_dst[:, :, 2] = cv2.LUT(hsv_src[:, :, 2], self._gamma_lut)
+        return hsv_dst
+    
+    def full_resolution_hsv(self):
+        """Return the full-resolution HSV image with the current adjustments.
         
-        @details Converts the numpy arrays to QImage format and displays them
-                in their respective QGraphicsView widgets while maintaining aspect ratio.
+        @brief Adjusted HSV image for saving and benchmarking
         
-        @exception ValueError If image data is invalid
-        @exception RuntimeError If graphics view initialization fails
+        @return Adjusted HSV image in OpenCV format (uint8)
+        @rtype numpy.ndarray
+        
+        @details Slider updates only process the small preview, so the full
+                image is adjusted on demand here and cached until the next
+                update or image load
         """
-        if self.original_image is None:
-            return
+        if not self._adjusted:
+            return self.hsv_image
+        if self._hsv_full_version != self._hsv_version:
+            self.adjust_hsv(self.hsv_image, self._hsv_full)
+            self._hsv_full_version = self._hsv_version
+        return self._hsv_full
+    
+    @pyqtSlot(int, object)
+    def _on_frame_ready(self, generation, rgb):
+        """Show a frame finished by a FrameWorker.
         
-        # Prepare original image for display
-        orig_img = self.original_image.copy()
-        orig_height, orig_width = orig_img.shape[:2]
+        @brief Receive background processing results on the GUI thread
         
-        # Create QImage from numpy array (original)
-        bytes_per_line = 3 * orig_width
-        q_orig_img = QImage(orig_img.data, orig_width, orig_height, 
-                          bytes_per_line, QImage.Format.Format_RGB888)
+        @param generation Generation counter value the frame was submitted with
+        @type generation int
+        @param rgb Adjusted RGB image
+        @type rgb numpy.ndarray
         
-        # Clear scenes and add images
-        self.original_scene.clear()
-        pixmap_item = QGraphicsPixmapItem(QPixmap.fromImage(q_orig_img))
-        self.original_scene.addItem(pixmap_item)
-        self.graphicsView.fitInView(pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+        @details Frames from an older generation (e.g. computed for a previously
+                loaded image) are discarded before the pixmap upload
+        """
+        self._busy = False
+        if generation == self._generation:
+            self.adjusted_image = rgb
+            self._refresh_adjusted()
+        if self._rerun:
+            self._rerun = False
+            self.update_image()
+    
+    def _refresh_adjusted(self):
+        """Display the adjusted image in the UI.
         
-        # Prepare adjusted image for display
-        adj_img = self.adjusted_image.copy()
-        adj_height, adj_width = adj_img.shape[:2]
+        @details Uploads the persistent QImage (which wraps the preallocated
+                self._adjusted_preview buffer) to the scene's pixmap item. The
+                scene and item are created once per image by load_image, so a
+                slider update neither rebuilds the scene nor re-wraps the buffer
         
-        # Create QImage from numpy array (adjusted)
-        bytes_per_line = 3 * adj_width
-        q_adj_img = QImage(adj_img.data, adj_width, adj_height, 
-                         bytes_per_line, QImage.Format.Format_RGB888)
+        @exception RuntimeError If graphics view initialization fails
+        """
+        if self.original_image is None:
+            return
         
-        self.adjusted_scene.clear()
-        pixmap_item2 = QGraphicsPixmapItem(QPixmap.fromImage(q_adj_img))
-        self.adjusted_scene.addItem(pixmap_item2)
-        self.graphicsView_2.fitInView(pixmap_item2, Qt.AspectRatioMode.KeepAspectRatio)
+        self._adj_pixmap_item.setPixmap(QPixmap.fromImage(self._q_adj_img))
     
     def resizeEvent(self, event):
         """Handle window resize events.
@@ -305,72 +761,29 @@ class HSVAdjustmentApp(QWidget):
         if hasattr(self, 'adjusted_scene') and self.adjusted_scene.items():
             self.graphicsView_2.fitInView(self.adjusted_scene.items()[0], Qt.AspectRatioMode.KeepAspectRatio)
     
-    def hsv_to_rgb_matrix(self, hsv_img):
+    def hsv_to_rgb_matrix(self, hsv_img, dst=None):
         """Convert HSV to RGB using vectorized matrix operations.
         
-        @brief Perform HSV to RGB conversion using optimized NumPy operations
+        @brief Perform HSV to RGB conversion using OpenCV's vectorized kernel
         
         @param hsv_img Input HSV image in OpenCV format (H: 0-180, S/V: 0-255)
         @type hsv_img numpy.ndarray
-        @return RGB image in uint8 format
+        @param dst Optional preallocated uint8 output with the same shape as hsv_img
+        @type dst numpy.ndarray or None
+        @return RGB image in uint8 format (dst if given)
         @rtype numpy.ndarray
         
-        @details Performs color space conversion using NumPy's optimized operations.
-                The conversion follows the standard HSV to RGB algorithm but vectorized
-                for better performance
+        @details Delegates the whole-image conversion to cv2.cvtColor, which runs
+                the SIMD-dispatched 8-bit HSV2RGB kernel in a single pass instead
+                of building float32 temporaries and per-region masks in NumPy.
+                The input is kept in uint8 so the 8u code path is selected
         
         @exception ValueError If input is not a 3-channel numpy array
         @exception TypeError If input array has incorrect data type
-        @exception MemoryError If insufficient memory for processing
+        @exception cv2.error If OpenCV fails to convert the image
         @see hsv_to_rgb_loop For the alternative implementation
         """
-        hsv_img = hsv_img.astype(np.float32)
-        # Scale hue from OpenCV's 0-180 range to 0-360 degrees
-        h, s, v = hsv_img[:, :, 0] * 2.0, hsv_img[:, :, 1], hsv_img[:, :, 2]
-        h = h / 60.0
-        s = s / 255.0
-        v = v / 255.0
-        c = v * s
-        x = c * (1 - np.abs((h % 2) - 1))
-        m = v - c
-        
-        # Initialize RGB with zeros
-        rgb = np.zeros_like(hsv_img)
-        
-        # Create a zeros array for the third channel with proper dimensions
-        zeros = np.zeros_like(c)
-        
-        # Apply the conversion for each hue region
-        mask = (h >= 0) & (h < 1)
-        r, g, b = c[mask], x[mask], zeros[mask]
-        rgb[mask, 0], rgb[mask, 1], rgb[mask, 2] = r, g, b
-        
-        mask = (h >= 1) & (h < 2)
-        r, g, b = x[mask], c[mask], zeros[mask]
-        rgb[mask, 0], rgb[mask, 1], rgb[mask, 2] = r, g, b
-        
-        mask = (h >= 2) & (h < 3)
-        r, g, b = zeros[mask], c[mask], x[mask]
-        rgb[mask, 0], rgb[mask, 1], rgb[mask, 2] = r, g, b
-        
-        mask = (h >= 3) & (h < 4)
-        r, g, b = zeros[mask], x[mask], c[mask]
-        rgb[mask, 0], rgb[mask, 1], rgb[mask, 2] = r, g, b
-        
-        mask = (h >= 4) & (h < 5)
-        r, g, b = x[mask], zeros[mask], c[mask]
-        rgb[mask, 0], rgb[mask, 1], rgb[mask, 2] = r, g, b
-        
-        mask = (h >= 5)
-        r, g, b = c[mask], zeros[mask], x[mask]
-        rgb[mask, 0], rgb[mask, 1], rgb[mask, 2] = r, g, b
-        
-        # Add the m value to each channel
-        rgb[:, :, 0] += m
-        rgb[:, :, 1] += m
-        rgb[:, :, 2] += m
-        
-        return (rgb * 255).clip(0, 255).astype(np.uint8)
+        return cv2.cvtColor(np.ascontiguousarray(hsv_img).astype(np.uint8, copy=False), cv2.COLOR_HSV2RGB, dst=dst)
     
     def hsv_to_rgb_loop(self, hsv_img):
         """Convert HSV to RGB using pixel-by-pixel loop processing.
@@ -383,42 +796,28 @@ class HSVAdjustmentApp(QWidget):
         @rtype numpy.ndarray
         
         @details This method processes each pixel individually, which is slower
-                but may be more memory-efficient for very large images
+                but may be more memory-efficient for very large images.
+                When Numba is installed the loop is JIT-compiled and runs in
+                parallel over rows; otherwise the pure Python loop is used
         
         @exception ValueError If input is not a 3-channel numpy array
         @exception TypeError If input array has incorrect data type
         @exception MemoryError If insufficient memory for processing
         @see hsv_to_rgb_matrix For the optimized matrix implementation
         """
-        hsv_img = hsv_img.astype(np.float32)
+        if _HAS_NUMBA:
+            with _KERNEL_LOCK:
+                return _hsv_to_rgb_loop_nb(hsv_img)
+        
         height, width = hsv_img.shape[:2]
-        rgb_img = np.zeros((height, width, 3), dtype=np.uint8)
+        rgb_img = np.empty((height, width, 3), dtype=np.uint8)
         
         for i in range(height):
+            # Plain ints are faster than NumPy scalars in the interpreter;
+            # converting a row at a time keeps the list overhead to one row
+            row = hsv_img[i].tolist()
             for j in range(width):
-                h, s, v = hsv_img[i, j]
-                # Scale hue from OpenCV's 0-180 range to 0-360 degrees
-                h = (h * 2.0) / 60.0
-                s = s / 255.0
-                v = v / 255.0
-                c = v * s
-                x = c * (1 - abs((h % 2) - 1))
-                m = v - c
-                
-                if 0 <= h < 1:
-                    r, g, b = c, x, 0
-                elif 1 <= h < 2:
-                    r, g, b = x, c, 0
-                elif 2 <= h < 3:
-                    r, g, b = 0, c, x
-                elif 3 <= h < 4:
-                    r, g, b = 0, x, c
-                elif 4 <= h < 5:
-                    r, g, b = x, 0, c
-                else:
-                    r, g, b = c, 0, x
-                
-                rgb_img[i, j] = [(r + m) * 255, (g + m) * 255, (b + m) * 255]
+                rgb_img[i, j] = _hsv_pixel_to_rgb(*row[j])
         
         return rgb_img
     
@@ -453,14 +852,16 @@ class HSVAdjustmentApp(QWidget):
         if not save_path:
             return
         
-        start = time.time()
+        hsv_image = self.full_resolution_hsv()
+        
+        start = time.perf_counter()
         if method == 'matrix':
-            rgb_image = self.hsv_to_rgb_matrix(self.current_hsv)
+            rgb_image = self.hsv_to_rgb_matrix(hsv_image)
         else:
-            rgb_image = self.hsv_to_rgb_loop(self.current_hsv)
+            rgb_image = self.hsv_to_rgb_loop(hsv_image)
         
-        cv2.imwrite(save_path, cv2.cvtColor(rgb_image, cv2.COLOR_RGB2BGR))
-        elapsed = time.time() - start
+        cv2.imwrite(save_path, cv2.cvtColor(rgb_image, cv2.COLOR_RGB2BGR, dst=self._bgr_scratch))
+        elapsed = time.perf_counter() - start
         
         QMessageBox.information(
             self,
@@ -477,6 +878,12 @@ class HSVAdjustmentApp(QWidget):
                 - 100x100 (small image)
                 - 400x400 (medium image)
                 - 800x800 (large image)
+                The resized test images are cached by compare_pyramid.
+                Both methods are run once on a tiny image before timing, then
+                each timing is the mean of COMPARE_RUNS runs measured with
+                time.perf_counter_ns. Without Numba the interpreted loop is
+                skipped above LOOP_MAX_PIXELS. The benchmark runs on a
+                QThreadPool thread and each row is shown as soon as it is ready
         
         @exception RuntimeError If comparison fails
         @exception MemoryError If insufficient memory for testing
@@ -488,30 +895,90 @@ class HSVAdjustmentApp(QWidget):
             QMessageBox.critical(self, "Error", "No image loaded!")
             return
         
-        sizes = [(100, 100), (400, 400), (800, 800)]
-        results = []
+        test_images = self.compare_pyramid()
         
-        for size in sizes:
-            test_hsv = cv2.resize(self.current_hsv, size)
-            
-            # Time matrix method
-            start = time.time()
-            _ = self.hsv_to_rgb_matrix(test_hsv)
-            matrix_time = time.time() - start
+        def rows():
+            # Warm up JIT/OpenCV dispatch so the first timed size measures steady state
+            warmup_hsv = np.zeros((4, 4, 3), dtype=np.uint8)
+            self.hsv_to_rgb_matrix(warmup_hsv)
+            self.hsv_to_rgb_loop(warmup_hsv)
             
-            # Time loop method
-            start = time.time()
-            _ = self.hsv_to_rgb_loop(test_hsv)
-            loop_time = time.time() - start
-            
-            speedup = loop_time / matrix_time
-            results.append(f"{size[0]}x{size[1]}: Matrix={matrix_time:.4f}s, Loop={loop_time:.4f}s, Speedup={speedup:.2f}x")
+            for size, test_hsv in test_images.items():
+                matrix_time = self.time_method(self.hsv_to_rgb_matrix, test_hsv)
+                
+                if not _HAS_NUMBA and size[0] * size[1] > LOOP_MAX_PIXELS:
+                    yield (f"{size[0]}x{size[1]}: Matrix={matrix_time:.6f}s, "
+                           f"Loop=skipped (>{LOOP_MAX_PIXELS // 1000}K px)")
+                    continue
+                
+                loop_time = self.time_method(self.hsv_to_rgb_loop, test_hsv)
+                speedup = loop_time / matrix_time
+                yield f"{size[0]}x{size[1]}: Matrix={matrix_time:.6f}s, Loop={loop_time:.6f}s, Speedup={speedup:.2f}x"
+        
+        self.CompareButton.setEnabled(False)
+        self._compare_rows = []
+        self._compare_box = QMessageBox(QMessageBox.Icon.Information, "Performance Comparison",
+                                        "Running...", parent=self)
+        self._compare_box.setWindowModality(Qt.WindowModality.NonModal)
+        self._compare_box.show()
+        
+        worker = CompareWorker(rows())
+        worker.signals.row.connect(self._on_compare_row)
+        worker.signals.finished.connect(self._on_compare_finished)
+        QThreadPool.globalInstance().start(worker)
+    
+    def compare_pyramid(self):
+        """Return the adjusted HSV image resized to every COMPARE_SIZES entry.
         
-        QMessageBox.information(
-            self,
-            "Performance Comparison",
-            "\n".join(results)
-        )
+        @brief Cached test images for compare_methods
+        
+        @return Mapping of (width, height) to resized HSV image
+        @rtype dict
+        
+        @details The resized copies are rebuilt only when the adjustment has
+                changed since they were made (tracked by a version counter),
+                so repeated comparisons do not resize the image again. The
+                copies are made on the GUI thread, so the benchmark worker
+                never reads a buffer that is being updated
+        """
+        if self._compare_pyramid_version != self._hsv_version:
+            hsv_image = self.full_resolution_hsv()
+            self._compare_pyramid = {size: cv2.resize(hsv_image, size) for size in COMPARE_SIZES}
+            self._compare_pyramid_version = self._hsv_version
+        return self._compare_pyramid
+    
+    @staticmethod
+    def time_method(method, hsv_img, runs=COMPARE_RUNS):
+        """Measure the mean run time of a conversion method.
+        
+        @param method Conversion method to time
+        @type method callable
+        @param hsv_img Input HSV image passed to the method
+        @type hsv_img numpy.ndarray
+        @param runs Number of timed runs to average
+        @type runs int
+        @return Mean time per run in seconds
+        @rtype float
+        """
+        start = time.perf_counter_ns()
+        for _ in range(runs):
+            method(hsv_img)
+        return (time.perf_counter_ns() - start) / runs / 1e9
+    
+    @pyqtSlot(str)
+    def _on_compare_row(self, row):
+        """Append a finished benchmark row to the comparison dialog.
+        
+        @param row Formatted result line for one image size
+        @type row str
+        """
+        self._compare_rows.append(row)
+        self._compare_box.setText("\n".join(self._compare_rows))
+    
+    @pyqtSlot()
+    def _on_compare_finished(self):
+        """Re-enable the Compare button once the benchmark is done."""
+        self.CompareButton.setEnabled(True)
 
     def showEvent(self, event):
         """Handle the initial window show event.